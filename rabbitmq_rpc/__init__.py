@@ -3,10 +3,15 @@ from aio_pika.patterns import RPC, JsonRPC
 from .client import RPCClient
 from .config import RabbitMQConfig
 from .exceptions import ConnectionError, RPCError, RPCClientException, EventRegistrationError, EventPublishError, EventSubscribeError
+from .patterns import DirectReplyRPC
+from .serializer import FastCodecRPC, MsgpackRPC
 
 __all__ = [
     'RPCClient',
     'RabbitMQConfig',
+    'DirectReplyRPC',
+    'FastCodecRPC',
+    'MsgpackRPC',
     'ConnectionError',
     'RPCError',
     'RPCClientException',
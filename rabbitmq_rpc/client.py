@@ -2,50 +2,103 @@ import asyncio
 import json
 import logging
 from asyncio import AbstractEventLoop, TimeoutError
-from typing import Type, Union, Callable, Any, Optional, Dict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Tuple, Type, Union, Callable, Any, Optional, Dict
 
 from aio_pika import (
-        connect_robust, DeliveryMode, Channel, ExchangeType, Message, exceptions, RobustConnection,
+        connect_robust, DeliveryMode, Channel, Exchange, ExchangeType, Message, exceptions, RobustConnection,
 )
 from aio_pika.connection import URL
+from aio_pika.pool import Pool
 from aio_pika.patterns import RPC, JsonRPC
 from pydantic import BaseModel
 
 from .config import RabbitMQConfig
 from .exceptions import ConnectionError, RPCError, EventRegistrationError, EventPublishError, EventSubscribeError
-from .utils import with_retry_and_timeout
+from .patterns import DirectReplyRPC
+from .serializer import FastCodecRPC, MsgpackRPC, json_dumps, msgpack_dumps, require_msgpack
+from .utils import with_retry_and_timeout, with_timeout
+
+
+_PERSISTENT = DeliveryMode.PERSISTENT
+_JSON_CT = 'application/json'
+_MSGPACK_CT = 'application/msgpack'
+
+
+_uvloop_attempted = False
+
+
+def _install_uvloop() -> None:
+    """Installs the uvloop event loop policy once, warning when it cannot take effect."""
+    global _uvloop_attempted
+    if _uvloop_attempted:
+        return
+    _uvloop_attempted = True
+    logger = logging.getLogger(__name__)
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning(
+            "use_uvloop is set but uvloop is not installed; "
+            "keeping the default event loop policy"
+        )
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        logger.warning(
+            "use_uvloop is set but an event loop is already running; "
+            "the uvloop policy only applies to loops created after this point"
+        )
+    uvloop.install()
+
+
+def _to_payload(data: Union[dict, BaseModel]) -> dict:
+    """Converts a Pydantic model to a plain dict, passing dicts through untouched."""
+    if isinstance(data, BaseModel):
+        return data.model_dump()
+    return data
 
 
 class RPCClient:
     """A wrapper for aio-pika that simplifies the usage of RabbitMQ with asynchronous RPC."""
 
     _instances: Dict[str, 'RPCClient'] = {}
-    _locks: Dict[str, asyncio.Lock] = {}
+    _create_lock: Optional[asyncio.Lock] = None
 
     def __init__(
         self,
         config: RabbitMQConfig,
-        rpc_cls: Type[RPC] = RPC,
+        rpc_cls: Type[RPC] = DirectReplyRPC,
         loop: Optional[AbstractEventLoop] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         """Initializes the RPCClient instance."""
         self.config = config
         self.rpc_cls = rpc_cls
-        self.loop = loop or asyncio.get_event_loop()
+        self.loop = loop
         self.logger = logger or logging.getLogger(__name__)
         self.rpc: Optional[Union[RPC, JsonRPC]] = None
         self.connection: Optional[RobustConnection] = None
+        self._url = config.get_url()
+        self._conn_pool: Optional[Pool] = None
+        self._channel_pool: Optional[Pool] = None
+        self._exchange_cache: Dict[Tuple[int, str, ExchangeType, bool], Exchange] = {}
+        self._pub_queue: Optional[asyncio.Queue] = None
+        self._publisher_task: Optional[asyncio.Task] = None
+        self._connected = False
 
     @property
     def url(self) -> str:
         """Returns the RabbitMQ URL."""
-        return self.config.get_url()
+        return self._url
 
     @staticmethod
     async def create(
         config: Optional[RabbitMQConfig] = None,
-        rpc_cls: Type[RPC] = RPC,
+        rpc_cls: Type[RPC] = DirectReplyRPC,
         loop: Optional[AbstractEventLoop] = None,
         logger: Optional[logging.Logger] = None,
         url: Optional[str] = None,
@@ -57,7 +110,12 @@ class RPCClient:
         ssl: bool = False,
         **kwargs,
     ) -> 'RPCClient':
-        """Creates or returns an existing instance of RPCClient."""
+        """Creates or returns an existing instance of RPCClient.
+
+        When ``config.use_uvloop`` is set, the uvloop policy is installed for
+        loops created after this point; set it process-wide before any event
+        loop starts for it to take effect on the loop this client runs on.
+        """
         if config is None:
             config = RabbitMQConfig(
                 host=host,
@@ -71,10 +129,24 @@ class RPCClient:
 
         url = config.get_url()
 
-        if url not in RPCClient._locks:
-            RPCClient._locks[url] = asyncio.Lock()
+        instance = RPCClient._instances.get(url)
+        if instance is not None:
+            return instance
+
+        if config.use_uvloop:
+            _install_uvloop()
+
+        if config.serializer == 'msgpack':
+            require_msgpack()
+            if rpc_cls in (RPC, DirectReplyRPC):
+                rpc_cls = MsgpackRPC
+        elif config.fast_codec and rpc_cls in (RPC, DirectReplyRPC):
+            rpc_cls = FastCodecRPC
 
-        async with RPCClient._locks[url]:
+        if RPCClient._create_lock is None:
+            RPCClient._create_lock = asyncio.Lock()
+
+        async with RPCClient._create_lock:
             if url not in RPCClient._instances:
                 loop = loop or asyncio.get_running_loop()
 
@@ -108,21 +180,37 @@ class RPCClient:
     @property
     def is_connected(self) -> bool:
         """Checks if the client is connected to RabbitMQ."""
-        return self.rpc is not None and self.rpc.channel and not self.rpc.channel.is_closed
+        return self._connected
 
     async def connect(self, **kwargs: Any) -> None:
-        """Connects to the RabbitMQ server."""
+        """Connects to the RabbitMQ server.
+
+        The channel created here is dedicated to ``self.rpc`` and stays open
+        for the client's lifetime; the publish path draws from the channel
+        pool instead of sharing it.
+        """
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
         try:
-            self.connection = await connect_robust(
-                url=URL(self.url), loop=self.loop,
+            self.connection = await connect_robust(url=URL(self.url))
+            self._conn_pool = Pool(
+                self._make_connection, max_size=self.config.connection_pool_size, loop=self.loop,
+            )
+            self._channel_pool = Pool(
+                self._make_pool_channel, max_size=self.config.channel_pool_size, loop=self.loop,
             )
             channel = await self.connection.channel()
+            await channel.set_qos(prefetch_count=self.config.rpc_prefetch or 32)
             self.rpc = await self.rpc_cls.create(channel, **kwargs)
-            self.rpc.loop = self.loop
+            self._pub_queue = asyncio.Queue()
+            self._publisher_task = self.loop.create_task(self._publisher_worker())
+            channel.close_callbacks.add(lambda *_: setattr(self, '_connected', False))
+            channel.reopen_callbacks.add(lambda *_: setattr(self, '_connected', True))
+            self._connected = True
             self.logger.info("Connected to RabbitMQ")
         except (exceptions.AMQPConnectionError, exceptions.AMQPChannelError) as e:
-            self.logger.error(f"Failed to connect to RabbitMQ at {self.url}: {str(e)}")
-            raise ConnectionError(f"Failed to connect to RabbitMQ: {str(e)}")
+            self.logger.error("Failed to connect to RabbitMQ at %s: %s", self.url, e)
+            raise ConnectionError("Failed to connect to RabbitMQ", e) from e
 
     async def reconnect(self, **kwargs: Any) -> None:
         """Reconnects to the RabbitMQ server."""
@@ -131,26 +219,45 @@ class RPCClient:
             await self.connect(**kwargs)
             self.logger.info("Reconnected to RabbitMQ")
         except ConnectionError as e:
-            self.logger.error(f"Failed to reconnect to RabbitMQ: {str(e)}")
-            raise e
+            self.logger.error("Failed to reconnect to RabbitMQ: %s", e)
+            raise
 
     async def close(self) -> None:
         """Closes the RabbitMQ connection."""
         if self.connection:
+            self._connected = False
             try:
+                if self._publisher_task is not None:
+                    self._publisher_task.cancel()
+                    try:
+                        await self._publisher_task
+                    except asyncio.CancelledError:
+                        pass
+                    self._publisher_task = None
+                if self._pub_queue is not None:
+                    while not self._pub_queue.empty():
+                        future = self._pub_queue.get_nowait()[-1]
+                        if not future.done():
+                            future.set_exception(ConnectionError("RPCClient is closing"))
+                    self._pub_queue = None
+                if self._channel_pool and not self._channel_pool.is_closed:
+                    await self._channel_pool.close()
+                if self._conn_pool and not self._conn_pool.is_closed:
+                    await self._conn_pool.close()
                 await self.connection.close()
                 self.rpc = None
                 self.connection = None
+                self._channel_pool = None
+                self._conn_pool = None
+                self._exchange_cache.clear()
                 self.logger.info("Closed RabbitMQ connection")
             except exceptions.AMQPError as e:
-                self.logger.error(f"Failed to close RabbitMQ connection: {str(e)}")
-                raise ConnectionError(f"Failed to close RabbitMQ connection: {str(e)}")
+                self.logger.error("Failed to close RabbitMQ connection: %s", e)
+                raise ConnectionError("Failed to close RabbitMQ connection", e) from e
 
     def set_event_loop(self, loop: AbstractEventLoop) -> None:
         """Sets the event loop for the RPC client."""
         self.loop = loop
-        if self.rpc:
-            self.rpc.loop = loop
 
     def set_logger(self, logger: logging.Logger) -> None:
         """Sets the logger for the RPC client."""
@@ -184,32 +291,58 @@ class RPCClient:
         data: Union[dict, Type[BaseModel]],
         expiration: Optional[int] = None,
         priority: int = 5,
-        delivery_mode: DeliveryMode = DeliveryMode.PERSISTENT,
+        delivery_mode: DeliveryMode = _PERSISTENT,
         timeout: Optional[float] = None,
         retry_count: int = 3,
-        **kwargs: Any,
     ) -> None:
         """Sends an event with the specified parameters."""
         if not self.is_connected:
             raise ConnectionError("RPCClient is not connected")
+        data = _to_payload(data)
         try:
-            if not isinstance(data, dict):
-                data = data.dict()
             await with_retry_and_timeout(
                 self.rpc.call(
-                    method_name=event,
-                    kwargs=data,
+                    event,
+                    data,
                     expiration=expiration,
                     priority=priority,
                     delivery_mode=delivery_mode,
-                    **kwargs,
                 ),
                 timeout,
                 retry_count,
             )
         except (TimeoutError, exceptions.AMQPError) as e:
-            self.logger.error(f"Failed to send event {event}: {str(e)}")
-            raise RPCError(f"Failed to send event {event}: {str(e)}")
+            self.logger.error("Failed to send event %s: %s", event, e)
+            raise RPCError("Failed to send event", event, e) from e
+
+    async def send_many(
+        self,
+        items: List[Tuple[str, Union[dict, BaseModel]]],
+        concurrency: int = 32,
+        expiration: Optional[int] = None,
+        priority: int = 5,
+        delivery_mode: DeliveryMode = _PERSISTENT,
+    ) -> None:
+        """Sends many events concurrently in one gather, bounded by concurrency."""
+        if not self.is_connected:
+            raise ConnectionError("RPCClient is not connected")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send_one(event: str, data: Union[dict, BaseModel]) -> None:
+            async with semaphore:
+                await self.rpc.call(
+                    event,
+                    _to_payload(data),
+                    expiration=expiration,
+                    priority=priority,
+                    delivery_mode=delivery_mode,
+                )
+
+        try:
+            await asyncio.gather(*[_send_one(event, data) for event, data in items])
+        except (TimeoutError, exceptions.AMQPError) as e:
+            self.logger.error("Failed to send events in bulk: %s", e)
+            raise RPCError("Failed to send events in bulk", e) from e
 
     async def call(
         self,
@@ -217,32 +350,29 @@ class RPCClient:
         data: Union[dict, Type[BaseModel]],
         expiration: Optional[int] = None,
         priority: int = 5,
-        delivery_mode: DeliveryMode = DeliveryMode.PERSISTENT,
+        delivery_mode: DeliveryMode = _PERSISTENT,
         timeout: Optional[float] = None,
         retry_count: int = 3,
-        **kwargs: Any,
     ) -> Any:
         """Calls an RPC method with the specified parameters."""
         if not self.is_connected:
             raise ConnectionError("RPCClient is not connected")
+        data = _to_payload(data)
         try:
-            if not isinstance(data, dict):
-                data = data.dict()
             return await with_retry_and_timeout(
                 self.rpc.call(
-                    method_name=event,
-                    kwargs=data,
+                    event,
+                    data,
                     expiration=expiration,
                     priority=priority,
                     delivery_mode=delivery_mode,
-                    **kwargs,
                 ),
                 timeout,
                 retry_count,
             )
         except (TimeoutError, exceptions.AMQPError) as e:
-            self.logger.error(f"Failed to call event {event}: {str(e)}")
-            raise RPCError(f"Failed to call event {event}: {str(e)}")
+            self.logger.error("Failed to call event %s: %s", event, e)
+            raise RPCError("Failed to call event", event, e) from e
 
     async def register_event(self, event: str, handler: Callable[..., Any], **kwargs: Any) -> None:
         """Registers an event handler."""
@@ -250,10 +380,10 @@ class RPCClient:
             raise ConnectionError("RPCClient is not connected")
         try:
             await self.rpc.register(method_name=event, func=handler, **kwargs)
-            self.logger.info(f"Registered event handler for {event}")
+            self.logger.info("Registered event handler for %s", event)
         except (exceptions.AMQPError, ValueError) as e:
-            self.logger.error(f"Failed to register event handler for {event}: {str(e)}")
-            raise EventRegistrationError(f"Failed to register event handler for {event}: {str(e)}")
+            self.logger.error("Failed to register event handler for %s: %s", event, e)
+            raise EventRegistrationError("Failed to register event handler", event, e) from e
 
     async def unregister_event(self, handler: Callable[..., Any]) -> None:
         """Unregisters an event handler."""
@@ -263,8 +393,8 @@ class RPCClient:
             await self.rpc.unregister(handler)
             self.logger.info("Unregistered event handler")
         except (exceptions.AMQPError, ValueError) as e:
-            self.logger.error(f"Failed to unregister event handler: {str(e)}")
-            raise EventRegistrationError(f"Failed to unregister event handler: {str(e)}")
+            self.logger.error("Failed to unregister event handler: %s", e)
+            raise EventRegistrationError("Failed to unregister event handler", e) from e
 
     async def publish_event(
         self, 
@@ -272,25 +402,36 @@ class RPCClient:
         routing_key: str, 
         message: Union[dict, Type[BaseModel]], 
         exchange_type: ExchangeType = ExchangeType.DIRECT, 
-        durable: bool = True, 
+        durable: bool = True,
         timeout: Optional[float] = None,
         retry_count: int = 3,
-        **kwargs: Any,
+        batch: bool = False,
+        headers: Optional[dict] = None,
+        mandatory: bool = True,
     ) -> None:
-        """Publishes an event to an exchange."""
+        """Publishes an event to an exchange, optionally coalescing it into a batch."""
         if not self.is_connected:
             raise ConnectionError("RPCClient is not connected")
+        if isinstance(message, BaseModel) and self.config.serializer != 'msgpack':
+            message = message.model_dump_json().encode()
+        else:
+            message = _to_payload(message)
         try:
-            if not isinstance(message, dict):
-                message = message.dict()
-            await with_retry_and_timeout(
-                self._publish(exchange_name, routing_key, message, exchange_type, durable, **kwargs),
-                timeout,
-                retry_count,
-            )
+            if batch:
+                future = self.loop.create_future()
+                self._pub_queue.put_nowait(
+                    (exchange_name, routing_key, message, exchange_type, durable, headers, mandatory, future)
+                )
+                await with_timeout(future, timeout)
+            else:
+                await with_retry_and_timeout(
+                    self._publish(exchange_name, routing_key, message, exchange_type, durable, headers, mandatory),
+                    timeout,
+                    retry_count,
+                )
         except (TimeoutError, exceptions.AMQPError) as e:
-            self.logger.error(f"Failed to publish event to exchange {exchange_name}: {str(e)}")
-            raise EventPublishError(f"Failed to publish event to exchange {exchange_name}: {str(e)}")
+            self.logger.error("Failed to publish event to exchange %s: %s", exchange_name, e)
+            raise EventPublishError("Failed to publish event to exchange", exchange_name, e) from e
 
     async def subscribe_event(
         self,
@@ -299,77 +440,168 @@ class RPCClient:
         handler: Callable[..., Any],
         exchange_type: ExchangeType = ExchangeType.TOPIC,
         durable: bool = True,
-        timeout: Optional[float] = None, 
-        retry_count: int = 3, 
+        routing_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        retry_count: int = 3,
         **kwargs: Any,
     ) -> None:
-        """Subscribes to an event from a queue."""
+        """Subscribes to an event from a queue, binding with routing_key (defaults to the queue name)."""
         if not self.is_connected:
             raise ConnectionError("RPCClient is not connected")
+        if routing_key is None:
+            routing_key = queue_name
         try:
             await with_retry_and_timeout(
-                self._subscribe(exchange_name, queue_name, handler, exchange_type, durable, **kwargs),
+                self._subscribe(exchange_name, queue_name, handler, exchange_type, durable, routing_key, **kwargs),
                 timeout,
                 retry_count,
             )
-        except (TimeoutError, exceptions.AMQPError) as e:
-            self.logger.error(f"Failed to subscribe to queue {queue_name}: {str(e)}")
-            raise EventSubscribeError(f"Failed to subscribe to queue {queue_name}: {str(e)}")
+        except (TimeoutError, exceptions.AMQPError, ValueError) as e:
+            self.logger.error("Failed to subscribe to queue %s: %s", queue_name, e)
+            raise EventSubscribeError("Failed to subscribe to queue", queue_name, e) from e
+
+    async def _make_connection(self) -> RobustConnection:
+        """Creates one robust connection for the connection pool.
+
+        Pooled channels are spread over these connections so publish
+        throughput is not serialized onto a single TCP socket.
+        """
+        return await connect_robust(url=URL(self.url))
+
+    async def _make_pool_channel(self) -> Channel:
+        """Creates a pooled channel with publisher confirms enabled.
+
+        Confirms let the batch worker pipeline publishes: every publish in a
+        batch goes on the wire immediately and the confirms are awaited
+        together in one gather, instead of one confirm round-trip per message.
+        """
+        async with self._conn_pool.acquire() as connection:
+            return await connection.channel(publisher_confirms=True)
+
+    @asynccontextmanager
+    async def _acquire_channel(self) -> AsyncIterator[Channel]:
+        """Acquires a channel from the pool, reopening it if the broker closed it."""
+        async with self._channel_pool.acquire() as channel:
+            if channel.is_closed:
+                await channel.reopen()
+            yield channel
+
+    async def _declare_exchange(
+        self,
+        channel: Channel,
+        exchange_name: str,
+        exchange_type: ExchangeType,
+        durable: bool,
+    ) -> Exchange:
+        """Declares an exchange once per channel, serving repeat declarations from a cache."""
+        key = (id(channel), exchange_name, exchange_type, durable)
+        exchange = self._exchange_cache.get(key)
+        if exchange is None:
+            exchange = await channel.declare_exchange(
+                exchange_name, type=exchange_type, durable=durable,
+            )
+            self._exchange_cache[key] = exchange
+            channel.close_callbacks.add(lambda *_: self._exchange_cache.pop(key, None))
+        return exchange
 
     async def _subscribe(
         self,
         exchange_name: str,
-        queue_name: str, 
+        queue_name: str,
         handler: Callable[..., Any],
         exchange_type: ExchangeType,
-        durable: bool, 
+        durable: bool,
+        routing_key: str,
         **kwargs: Any,
     ) -> None:
         """Helper function to subscribe to a queue."""
-        try:
-            channel = await self.connection.channel()
-            exchange = await channel.declare_exchange(
-                exchange_name, type=exchange_type, durable=True
-            )
+        async with self._acquire_channel() as channel:
+            exchange = await self._declare_exchange(channel, exchange_name, exchange_type, True)
             queue = await channel.declare_queue(queue_name, durable=durable, **kwargs)
 
-            await queue.bind(exchange, queue_name)
+            await queue.bind(exchange, routing_key)
             await queue.consume(handler)
-            self.logger.info(f"Subscribed to queue {queue_name}")
-        except (exceptions.AMQPError, ValueError) as e:
-            self.logger.error(f"Failed to subscribe to queue {queue_name}: {str(e)}")
-            raise EventSubscribeError(f"Failed to subscribe to queue {queue_name}: {str(e)}")
+        self.logger.info("Subscribed to queue %s", queue_name)
 
     async def _publish(
         self, 
         exchange_name: str, 
-        routing_key: str, 
-        message: dict, 
-        exchange_type: ExchangeType, 
-        durable: bool, 
-        **kwargs: Any,
+        routing_key: str,
+        message: Union[dict, bytes],
+        exchange_type: ExchangeType,
+        durable: bool,
+        headers: Optional[dict] = None,
+        mandatory: bool = True,
     ) -> None:
         """Helper function to publish an event to an exchange."""
         try:
-            channel = await self.connection.channel()
-            exchange = await channel.declare_exchange(
-                exchange_name, 
-                type=exchange_type,
-                durable=durable,
-            )
-            await exchange.publish(
-                Message(
-                    body=json.dumps(message).encode(),
-                    content_type='application/json',
-                    delivery_mode=DeliveryMode.PERSISTENT,
-                ),
-                routing_key=routing_key,
-                **kwargs,
-            )
-            self.logger.info(f"Published event to exchange {exchange_name} with routing key {routing_key}")
+            async with self._acquire_channel() as channel:
+                await self._publish_on_channel(
+                    channel, exchange_name, routing_key, message, exchange_type, durable, headers, mandatory,
+                )
+            self.logger.debug("Published event to exchange %s with routing key %s", exchange_name, routing_key)
         except (exceptions.AMQPError, json.JSONDecodeError) as e:
-            self.logger.error(f"Failed to publish event: {str(e)}")
-            raise EventPublishError(f"Failed to publish event: {str(e)}")
+            self.logger.error("Failed to publish event: %s", e)
+            raise EventPublishError("Failed to publish event", e) from e
+
+    async def _publish_on_channel(
+        self,
+        channel: Channel,
+        exchange_name: str,
+        routing_key: str,
+        message: Union[dict, bytes],
+        exchange_type: ExchangeType,
+        durable: bool,
+        headers: Optional[dict] = None,
+        mandatory: bool = True,
+    ) -> None:
+        """Publishes a single message on an already-acquired channel."""
+        exchange = await self._declare_exchange(channel, exchange_name, exchange_type, durable)
+        if isinstance(message, bytes):
+            body, content_type = message, _JSON_CT
+        elif self.config.serializer == 'msgpack':
+            body, content_type = msgpack_dumps(message), _MSGPACK_CT
+        else:
+            body, content_type = json_dumps(message), _JSON_CT
+        await exchange.publish(
+            Message(body, headers=headers, content_type=content_type, delivery_mode=_PERSISTENT),
+            routing_key,
+            mandatory=mandatory,
+        )
+
+    async def _publisher_worker(self) -> None:
+        """Background task that drains queued publishes and flushes each batch on one channel."""
+        while True:
+            batch = [await self._pub_queue.get()]
+            while not self._pub_queue.empty() and len(batch) < self.config.publish_batch_size:
+                batch.append(self._pub_queue.get_nowait())
+            try:
+                async with self._acquire_channel() as channel:
+                    results = await asyncio.gather(
+                        *[
+                            self._publish_on_channel(
+                                channel, exchange_name, routing_key, message, exchange_type, durable, headers, mandatory,
+                            )
+                            for exchange_name, routing_key, message, exchange_type, durable, headers, mandatory, _ in batch
+                        ],
+                        return_exceptions=True,
+                    )
+            except asyncio.CancelledError:
+                for item in batch:
+                    future = item[-1]
+                    if not future.done():
+                        future.set_exception(ConnectionError("RPCClient is closing"))
+                raise
+            except Exception as e:
+                results = [e] * len(batch)
+            for item, result in zip(batch, results):
+                future = item[-1]
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
 
     def __repr__(self) -> str:
         """Returns a string representation of the RPCClient instance."""
@@ -3,7 +3,7 @@ from typing import Optional, TypeVar
 
 from aio_pika.connection import make_url
 from decouple import config
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 T = TypeVar('T')
 
@@ -22,6 +22,15 @@ class RabbitMQConfig(BaseModel):
     vhost: Optional[str] = Field(default_factory=lambda: env_var("RABBITMQ_VHOST", "/", str))
     ssl: Optional[bool] = Field(default=False)
     url: Optional[str] = Field(default=None)
+    channel_pool_size: Optional[int] = Field(default_factory=lambda: env_var("RABBITMQ_CHANNEL_POOL_SIZE", 10, int))
+    connection_pool_size: Optional[int] = Field(default_factory=lambda: env_var("RABBITMQ_CONNECTION_POOL_SIZE", 2, int))
+    serializer: Optional[str] = Field(default_factory=lambda: env_var("RABBITMQ_SERIALIZER", "json", str))
+    publish_batch_size: Optional[int] = Field(default_factory=lambda: env_var("RABBITMQ_PUBLISH_BATCH_SIZE", 100, int))
+    rpc_prefetch: Optional[int] = Field(default_factory=lambda: env_var("RABBITMQ_RPC_PREFETCH", 32, int))
+    use_uvloop: Optional[bool] = Field(default=False)
+    fast_codec: Optional[bool] = Field(default=False)
+
+    _cached_url: Optional[str] = PrivateAttr(default=None)
 
     def __repr__(self) -> str:
         attributes = self.dict(exclude={"url"})
@@ -33,14 +42,16 @@ class RabbitMQConfig(BaseModel):
         return self.__repr__()
 
     def get_url(self) -> str:
-        return str(
-            make_url(
-                url=self.url,
-                host=self.host,
-                port=self.port,
-                login=self.user,
-                password=self.password,
-                virtualhost=self.vhost,
-                ssl=self.ssl
+        if self._cached_url is None:
+            self._cached_url = str(
+                make_url(
+                    url=self.url,
+                    host=self.host,
+                    port=self.port,
+                    login=self.user,
+                    password=self.password,
+                    virtualhost=self.vhost,
+                    ssl=self.ssl
+                )
             )
-        )
+        return self._cached_url
@@ -1,6 +1,13 @@
 class RPCClientException(Exception):
-    """Base exception for RPCClient errors."""
-    pass
+    """Base exception for RPCClient errors.
+
+    Accepts structured arguments (context values and the causing exception)
+    and joins them lazily in __str__, so no message string is built unless
+    the exception is actually formatted.
+    """
+
+    def __str__(self) -> str:
+        return ": ".join(str(arg) for arg in self.args)
 
 class ConnectionError(RPCClientException):
     """Raised when there is a connection error."""
@@ -20,6 +20,11 @@ setup(
         "pydantic>=2",
         "python-decouple",
     ],
+    extras_require={
+        "orjson": ["orjson"],
+        "msgpack": ["msgpack"],
+        "uvloop": ["uvloop"],
+    },
     license='Apache License 2.0',
     keywords="event rpc aio-pika rabbitmq microservice remote-procedure-call async python",
     classifiers=[